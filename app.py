@@ -4,6 +4,8 @@ import requests
 import logging
 from flask import Flask, send_from_directory, request, jsonify
 from flask_cors import CORS
+from werkzeug.exceptions import NotFound
+from requests.adapters import HTTPAdapter
 from requests.exceptions import RequestException, Timeout, ConnectionError
 
 # Setup logging
@@ -19,26 +21,44 @@ CORS(app, resources={r"/*": {"origins": "*"}})
 # Default Rasa server URL
 DEFAULT_RASA_URL = 'http://localhost:5005/webhooks/rest/webhook'
 
+# Rasa endpoints, resolved once at startup
+RASA_WEBHOOK_URL = os.environ.get('RASA_URL', DEFAULT_RASA_URL)
+RASA_VERSION_URL = f"{os.environ.get('RASA_URL', 'http://localhost:5005')}/version"
+
+# Shared HTTP session so connections to Rasa are kept alive between requests
+rasa_session = requests.Session()
+rasa_adapter = HTTPAdapter(pool_connections=10, pool_maxsize=50)
+rasa_session.mount('http://', rasa_adapter)
+rasa_session.mount('https://', rasa_adapter)
+
+# Fallback replies shown to the user
+EMPTY_RESPONSE_TEXT = "I didn't receive a proper response. Please try again."
+SERVER_ERROR_TEXT = "I'm sorry, I encountered an error processing your request. Please try again later."
+
 # Serve frontend files
 @app.route('/', defaults={'path': ''})
 @app.route('/<path:path>')
 def serve_static(path):
-    if path and os.path.exists(os.path.join(app.static_folder, path)):
-        return send_from_directory(app.static_folder, path)
+    # send_from_directory already stats the file and answers conditional
+    # requests, so let it decide whether the asset exists
+    if path:
+        try:
+            return send_from_directory(app.static_folder, path)
+        except NotFound:
+            pass
     return send_from_directory(app.static_folder, 'index.html')
 
 @app.route('/api/check_rasa', methods=['GET'])
 def check_rasa():
-    rasa_url = os.environ.get('RASA_URL', 'http://localhost:5005')
     try:
         # Try to connect to the server's health endpoint
-        response = requests.get(f"{rasa_url}/version", timeout=3)
+        response = rasa_session.get(RASA_VERSION_URL, timeout=3)
         if response.ok:
             return jsonify({"status": "available", "version": response.json()})
         else:
             return jsonify({"status": "unavailable", "reason": "API responded with error"}), 503
     except RequestException as e:
-        logger.error(f"Failed to connect to Rasa server: {str(e)}")
+        logger.error("Failed to connect to Rasa server: %s", e)
         return jsonify({"status": "unavailable", "reason": str(e)}), 503
 
 
@@ -49,7 +69,6 @@ def send_message():
     message = data.get('message')
     context = data.get('context', {})
 
-    rasa_url = os.environ.get('RASA_URL', DEFAULT_RASA_URL)
     payload = {
         "sender": "user",
         "message": message,
@@ -57,7 +76,7 @@ def send_message():
     }
 
     try:
-        response = requests.post(rasa_url, json=payload, timeout=30)
+        response = rasa_session.post(RASA_WEBHOOK_URL, json=payload, timeout=30)
         response.raise_for_status()
         data = response.json()
         return jsonify(process_rasa_response(data, context))
@@ -67,7 +86,7 @@ def send_message():
         return jsonify({
             "error": error_message,
             "context": context,
-            "messages": [{"text": "I'm sorry, I encountered an error processing your request. Please try again later."}]
+            "messages": [{"text": SERVER_ERROR_TEXT}]
         }), 500
 
 
@@ -78,27 +97,27 @@ def process_rasa_response(response, original_context):
         "actions": []
     }
 
-    if not response or len(response) == 0:
-        result["messages"].append(
-            {"text": "I didn't receive a proper response. Please try again."})
+    if not response:
+        result["messages"].append({"text": EMPTY_RESPONSE_TEXT})
         return result
 
     for item in response:
-        if item.get("text"):
-            result["messages"].append({"text": item["text"]})
+        text = item.get("text")
+        if text:
+            result["messages"].append({"text": text})
             
         # Check for json_message format which is used by newer Rasa SDK
-        if item.get("json_message"):
-            json_data = item["json_message"]
-            
+        json_data = item.get("json_message")
+        if json_data:
             # Extract action information
-            if json_data.get("action"):
-                action = json_data["action"]
+            action = json_data.get("action")
+            if action:
                 result["actions"].append(action)
             
             # Update context with any new information
-            if json_data.get("context"):
-                result["context"].update(json_data["context"])
+            json_context = json_data.get("context")
+            if json_context:
+                result["context"].update(json_context)
                 
             # Continue processing other parts of the message
             continue
@@ -111,14 +130,16 @@ def process_rasa_response(response, original_context):
                     custom_data = json.loads(custom_data)
                 except json.JSONDecodeError:
                     logger.warning(
-                        f"Failed to decode custom JSON: {custom_data}")
+                        "Failed to decode custom JSON: %s", custom_data)
                     continue
 
-            if custom_data.get("action"):
-                result["actions"].append(custom_data["action"])
+            action = custom_data.get("action")
+            if action:
+                result["actions"].append(action)
                 
-            if custom_data.get("context"):
-                result["context"].update(custom_data["context"])
+            custom_context = custom_data.get("context")
+            if custom_context:
+                result["context"].update(custom_context)
 
         if item.get("image"):
             result["messages"].append({"type": "image", "url": item["image"]})
@@ -134,7 +155,7 @@ def process_rasa_response(response, original_context):
 
 if __name__ == '__main__':
     port = int(os.environ.get('PORT', 3000))
-    logger.info(f"Chatbot server running on http://localhost:{port}")
+    logger.info("Chatbot server running on http://localhost:%s", port)
     logger.info("To use with Rasa, make sure to start the Rasa server with:")
     logger.info("  - rasa run --enable-api --cors \"*\"")
     app.run(debug=True, port=port)